@@ -0,0 +1,98 @@
+import os
+import json
+import math
+import threading
+from typing import Optional
+
+# Per-config latency samples persisted between runs
+latency_history_file = os.environ.get("latency_history_file") or "latency_history.json"
+
+# Samples kept per (config, kind) — old ones roll off so the timeouts follow the current state of each device
+MAX_SAMPLES = 20
+# Below this many samples the hardcoded default is used
+MIN_SAMPLES = 5
+
+PERCENTILE = 0.95
+MARGIN     = 1.5   # multiplier on the percentile
+PAD_SECS   = 2.0   # plus a fixed pad for network jitter on very fast waits
+BACKOFF    = 2.0   # after a timeout the next run waits at least this many times longer
+
+# (lower, upper) bound in seconds per kind of wait
+BOUNDS = {
+    "session_create": (30, 300),
+    "page_load":      (10, 120),
+    "navigation":     (5, 90),
+    "nav_click":      (5, 60),
+    "article_load":   (5, 60),
+    "consent":        (2, 15),
+}
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    # Nearest-rank percentile
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(pct * len(ordered)) - 1)]
+
+
+class LatencyHistory:
+    """ Observed durations per browser config and kind of wait, stored as JSON, turned into timeouts. """
+
+    def __init__(self, path: str = latency_history_file):
+        self.path      = path
+        self.lock      = threading.Lock()
+        self.samples   = {}
+        # Last timeout hit per (config, kind), cleared by the next success
+        self.timed_out = {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            # Files from before timeouts were tracked hold the samples at the top level
+            self.samples   = data["samples"] if "samples" in data else data
+            self.timed_out = data.get("timed_out", {})
+        except (OSError, ValueError, TypeError):
+            pass
+
+    def _append(self, key: str, kind: str, secs: float) -> None:
+        history = self.samples.setdefault(key, {}).setdefault(kind, [])
+        history.append(round(secs, 3))
+        del history[:-MAX_SAMPLES]
+
+    def record(self, key: str, kind: str, secs: float) -> None:
+        with self.lock:
+            self._append(key, kind, secs)
+            self.timed_out.get(key, {}).pop(kind, None)
+
+    def record_timeout(self, key: str, kind: str, timeout: Optional[float]) -> None:
+        # Censored sample — the real latency was at least the timeout, so it still pushes the percentile up
+        if timeout is None:
+            return
+        with self.lock:
+            self._append(key, kind, timeout)
+            self.timed_out.setdefault(key, {})[kind] = timeout
+
+    def timeout(self, key: str, kind: str, default: Optional[float]) -> tuple:
+        """ Returns (timeout, source) — p95 × margin + pad within BOUNDS once there's enough history, else the default.
+            After a timeout, at least BACKOFF × the timeout that was hit, so a device that slowed down isn't stuck failing. """
+        with self.lock:
+            history   = list(self.samples.get(key, {}).get(kind, []))
+            last_miss = self.timed_out.get(key, {}).get(kind)
+
+        lower, upper = BOUNDS[kind]
+        if len(history) < MIN_SAMPLES:
+            value, source = default, "default"
+        else:
+            learned       = percentile(history, PERCENTILE) * MARGIN + PAD_SECS
+            value, source = round(min(upper, max(lower, learned)), 1), f"p95 of {len(history)}"
+
+        if last_miss is not None:
+            widened = round(min(upper, last_miss * BACKOFF), 1)
+            if value is None or widened > value:
+                value, source = widened, f"widened after {last_miss:g}s timeout"
+        return value, source
+
+    def save(self) -> None:
+        with self.lock:
+            tmp = f"{self.path}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"samples": self.samples, "timed_out": self.timed_out}, f, indent=2, sort_keys=True)
+            os.replace(tmp, self.path)
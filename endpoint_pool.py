@@ -0,0 +1,70 @@
+import json
+import time
+import threading
+from typing import Optional
+
+
+def load_endpoints(path: str) -> list[dict]:
+    """ Reads a JSON list of WebDriver endpoints — see endpoints.example.json for the format. """
+
+    with open(path, encoding="utf-8") as f:
+        endpoints = json.load(f)
+
+    for ep in endpoints:
+        if "name" not in ep or "url" not in ep:
+            raise ValueError(f"Endpoint needs 'name' and 'url': {ep}")
+        ep.setdefault("max_sessions", 1)
+        ep.setdefault("match", {})
+        ep.setdefault("browserstack", False)
+    return endpoints
+
+
+def accepts(endpoint: dict, config: dict) -> bool:
+    # Every key in "match" must list the config's value — null in the list allows a missing key
+    return all(config.get(key) in allowed for key, allowed in endpoint["match"].items())
+
+
+class EndpointUnavailable(Exception):
+    """ No compatible endpoint freed a slot within the pool's acquire timeout. """
+
+
+class EndpointPool:
+    """ Hands out WebDriver endpoints to configs — least-loaded compatible endpoint first, blocking while all are full. """
+
+    def __init__(self, endpoints: list[dict], acquire_timeout: float = 900):
+        self.endpoints       = endpoints
+        self.acquire_timeout = acquire_timeout
+        self.active          = {ep["name"]: 0 for ep in endpoints}
+        self.cond            = threading.Condition()
+
+    def acquire(self, config: dict, exclude: tuple = ()) -> Optional[dict]:
+        # Returns None once no compatible endpoint is left to try.
+        # Waits at most acquire_timeout for a slot, so a leaked slot can't hang the whole run.
+        deadline = time.monotonic() + self.acquire_timeout
+        with self.cond:
+            while True:
+                candidates = [
+                    ep for ep in self.endpoints
+                    if ep["name"] not in exclude and accepts(ep, config)
+                ]
+                if not candidates:
+                    return None
+
+                free = [ep for ep in candidates if self.active[ep["name"]] < ep["max_sessions"]]
+                if free:
+                    # Load = share of the endpoint's concurrency already in use
+                    endpoint = min(free, key=lambda ep: self.active[ep["name"]] / ep["max_sessions"])
+                    self.active[endpoint["name"]] += 1
+                    return endpoint
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise EndpointUnavailable(
+                        f"No free slot on {', '.join(ep['name'] for ep in candidates)} after {self.acquire_timeout:g}s"
+                    )
+                self.cond.wait(remaining)
+
+    def release(self, endpoint: dict) -> None:
+        with self.cond:
+            self.active[endpoint["name"]] -= 1
+            self.cond.notify_all()
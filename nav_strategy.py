@@ -0,0 +1,204 @@
+import os
+import json
+import time
+import threading
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+# El País URLs + header nav link to the Opinion section
+home_url          = "https://elpais.com"
+opinion_url       = "https://elpais.com/opinion/"
+opinion_nav_xpath = "/html/body/div[4]/header/div[2]/div[1]/nav/div/a[2]"
+
+# Route stats persisted between runs (per browser config)
+nav_stats_file = os.environ.get("nav_stats_file") or "nav_stats.json"
+
+# Short wait used when re-trying a route that already succeeded for this config
+PROBE_TIMEOUT = 5
+
+# Default order when there is no history — same as the original flow
+ROUTES = ("click", "direct", "skip_home")
+
+# Every route gets this many attempts before the ranking trusts its numbers
+EXPLORE_TRIES = 2
+
+
+class NavStats:
+    """ Per-config success/failure counts and timings for each navigation route, stored as JSON. """
+
+    def __init__(self, path: str = nav_stats_file):
+        self.path  = path
+        self.lock  = threading.Lock()
+        self.stats = {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                self.stats = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    def _route(self, key: str, route: str) -> dict:
+        s = self.stats.setdefault(key, {}).setdefault(
+            route, {"successes": 0, "failures": 0, "total_secs": 0.0}
+        )
+        s.setdefault("fail_secs", 0.0)
+        return s
+
+    def is_proven(self, key: str, route: str) -> bool:
+        with self.lock:
+            return self.stats.get(key, {}).get(route, {}).get("successes", 0) > 0
+
+    def ordered_routes(self, key: str) -> list[str]:
+        # Under-explored routes first, then by expected seconds per success, then routes that only ever failed
+        with self.lock:
+            history = self.stats.get(key, {})
+
+            def rank(route):
+                s = history.get(route, {})
+                successes, failures = s.get("successes", 0), s.get("failures", 0)
+                if successes + failures < EXPLORE_TRIES:
+                    return (0, float(successes + failures), ROUTES.index(route))
+                if successes:
+                    # Time lost on failed attempts counts against the route, so a flaky fast route can lose to a reliable one
+                    cost = (s["total_secs"] + s.get("fail_secs", 0.0)) / successes
+                    return (1, cost, ROUTES.index(route))
+                return (2, float(failures), ROUTES.index(route))
+
+            return sorted(ROUTES, key=rank)
+
+    def record(self, key: str, route: str, ok: bool, secs: float) -> None:
+        with self.lock:
+            s = self._route(key, route)
+            if ok:
+                s["successes"]  += 1
+                s["total_secs"] += round(secs, 3)
+            else:
+                s["failures"]  += 1
+                s["fail_secs"] += round(secs, 3)
+
+    def save(self) -> None:
+        with self.lock:
+            tmp = f"{self.path}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.stats, f, indent=2, sort_keys=True)
+            os.replace(tmp, self.path)
+
+
+def _html_lang(driver) -> str:
+    return driver.find_element(By.TAG_NAME, "html").get_attribute("lang") or ""
+
+
+def _timed(state: dict, kind: str, wait, probing: bool = False):
+    # Reports how long one bounded wait took (or that it hit its timeout) to the caller's on_wait hook.
+    # A probe that runs out says nothing about the caller's own timeout, so it isn't reported as a timeout.
+    start = time.time()
+    try:
+        result = wait()
+    except TimeoutException:
+        if not probing:
+            state["on_wait"](kind, time.time() - start, True)
+        raise
+    state["on_wait"](kind, time.time() - start, False)
+    return result
+
+
+def _get(driver, state: dict, url: str) -> None:
+    _timed(state, "page_load", lambda: driver.get(url))
+
+
+def _accept_cookies_timed(state: dict, accept_cookies) -> None:
+    start = time.time()
+    accept_cookies()
+    state["cookie_secs"] = time.time() - start
+
+
+def _open_home(driver, state: dict, accept_cookies, log) -> None:
+    # click + direct share the homepage visit — only pay for it once per run
+    if state.get("home"):
+        return
+    start = time.time()
+    _get(driver, state, home_url)
+    log(f"Opened: {driver.current_url}")
+    html_lang = _html_lang(driver)
+    log("Confirmed: Page is in Spanish" if "es" in html_lang.lower() else "Warning: Spanish not confirmed")
+    _accept_cookies_timed(state, accept_cookies)
+    state["home"]      = True
+    state["home_secs"] = time.time() - start
+
+
+def _route_click(driver, state, accept_cookies, log, probe) -> None:
+    _open_home(driver, state, accept_cookies, log)
+    link = _timed(state, "nav_click", lambda: WebDriverWait(driver, probe or state["click_timeout"]).until(
+        EC.element_to_be_clickable((By.XPATH, opinion_nav_xpath))
+    ), probing=probe is not None)
+    link.click()
+
+
+def _route_direct(driver, state, accept_cookies, log, probe) -> None:
+    _open_home(driver, state, accept_cookies, log)
+    _get(driver, state, opinion_url)
+
+
+def _route_skip_home(driver, state, accept_cookies, log, probe) -> None:
+    # Language is checked on the Opinion page itself — no lang attribute means the route can't be used
+    _get(driver, state, opinion_url)
+    log(f"Opened: {driver.current_url}")
+    html_lang = _html_lang(driver)
+    if not html_lang:
+        raise TimeoutException("Opinion page has no lang attribute — cannot verify Spanish")
+    log("Confirmed: Page is in Spanish" if "es" in html_lang.lower() else "Warning: Spanish not confirmed")
+    if "cookie_secs" not in state:
+        _accept_cookies_timed(state, accept_cookies)
+
+
+def _wait_for_opinion(driver, timeout: float) -> None:
+    # Any El País section (and the homepage itself) has <article> cards — only the URL proves this is Opinion
+    wait = WebDriverWait(driver, timeout)
+    wait.until(EC.url_contains("/opinion"))
+    wait.until(EC.presence_of_element_located((By.TAG_NAME, "article")))
+
+
+_route_funcs = {
+    "click":     _route_click,
+    "direct":    _route_direct,
+    "skip_home": _route_skip_home,
+}
+
+
+def navigate_to_opinion(driver, key: str, stats: NavStats, timeout: float, accept_cookies, log=print, on_wait=None,
+                        click_timeout: float = None) -> str:
+    """ Opens the Opinion section via the fastest proven route for this config, falling back through the rest. Returns the route used.
+        click_timeout bounds the wait for the header nav link (default: timeout).
+        on_wait(kind, secs, timed_out) is called for every page load ("page_load"), header link wait ("nav_click")
+        and Opinion <article> wait ("navigation"). """
+
+    state = {
+        "on_wait":       on_wait or (lambda kind, secs, timed_out: None),
+        "click_timeout": click_timeout or timeout,
+    }
+    for i, route in enumerate(stats.ordered_routes(key)):
+        # Learned route gets a short probe (header link and Opinion <article> wait); unproven routes keep the full timeout
+        probe = PROBE_TIMEOUT if i == 0 and stats.is_proven(key, route) else None
+        start = time.time()
+
+        # Work an earlier failed route already did still counts towards this one, so every route is timed the same way
+        if route == "skip_home":
+            carried = state.get("cookie_secs", 0.0)
+        else:
+            carried = state.get("home_secs", 0.0)
+
+        try:
+            _route_funcs[route](driver, state, accept_cookies, log, probe)
+            _timed(state, "navigation", lambda: _wait_for_opinion(driver, probe or timeout), probing=probe is not None)
+        except (TimeoutException, WebDriverException) as e:
+            stats.record(key, route, False, time.time() - start + carried)
+            log(f"Route '{route}' failed after {time.time() - start:.1f}s — {type(e).__name__}")
+            continue
+
+        elapsed = time.time() - start + carried
+        stats.record(key, route, True, elapsed)
+        log(f"Opinion section loaded via '{route}' in {elapsed:.1f}s")
+        return route
+
+    raise TimeoutException("Opinion section unreachable via every navigation route")
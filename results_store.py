@@ -0,0 +1,247 @@
+import os
+import time
+import uuid
+import queue
+import sqlite3
+import threading
+from dotenv import load_dotenv
+
+# Run directly (python results_store.py), nothing else has loaded .env yet
+load_dotenv()
+
+# Append-only SQLite store for every run's results
+results_db = os.environ.get("results_db") or "results.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id      TEXT PRIMARY KEY,
+    source      TEXT NOT NULL,
+    started_at  REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS browser_results (
+    run_id      TEXT NOT NULL,
+    label       TEXT NOT NULL,
+    status      TEXT NOT NULL,
+    error       TEXT,
+    endpoint    TEXT,
+    nav_route   TEXT,
+    recorded_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS articles (
+    run_id        TEXT NOT NULL,
+    label         TEXT NOT NULL,
+    idx           INTEGER NOT NULL,
+    title         TEXT,
+    title_english TEXT,
+    content       TEXT,
+    article_url   TEXT,
+    image_url     TEXT,
+    recorded_at   REAL NOT NULL,
+    section       TEXT
+);
+CREATE TABLE IF NOT EXISTS translations (
+    run_id      TEXT NOT NULL,
+    label       TEXT NOT NULL,
+    idx         INTEGER NOT NULL,
+    lang        TEXT NOT NULL,
+    text        TEXT,
+    recorded_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS word_counts (
+    run_id      TEXT NOT NULL,
+    label       TEXT NOT NULL,
+    lang        TEXT NOT NULL,
+    word        TEXT NOT NULL,
+    count       INTEGER NOT NULL,
+    recorded_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS timings (
+    run_id      TEXT NOT NULL,
+    label       TEXT NOT NULL,
+    name        TEXT NOT NULL,
+    secs        REAL NOT NULL,
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_browser_results_time ON browser_results (recorded_at);
+CREATE INDEX IF NOT EXISTS idx_articles_time        ON articles (recorded_at);
+CREATE INDEX IF NOT EXISTS idx_articles_url         ON articles (article_url);
+CREATE INDEX IF NOT EXISTS idx_word_counts_time     ON word_counts (lang, recorded_at);
+CREATE INDEX IF NOT EXISTS idx_timings_time         ON timings (name, recorded_at);
+"""
+
+TABLES = ("runs", "browser_results", "articles", "translations", "word_counts", "timings")
+
+
+class ResultsStore:
+    """ Batches inserts on a background writer thread so scraping threads never wait on disk. Rows are only ever inserted. """
+
+    def __init__(self, path: str = results_db, batch_size: int = 200, flush_secs: float = 1.0):
+        self.path       = path
+        self.batch_size = batch_size
+        self.flush_secs = flush_secs
+        self.queue      = queue.Queue()
+        self.dropped    = 0
+
+        with sqlite3.connect(path) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            # Stores created before multi-section crawls have no section column
+            columns = [c[1] for c in conn.execute("PRAGMA table_info(articles)")]
+            if "section" not in columns:
+                conn.execute("ALTER TABLE articles ADD COLUMN section TEXT")
+
+        self.writer = threading.Thread(target=self._write_loop, name="results-writer", daemon=True)
+        self.writer.start()
+
+    # ── Writer ───────────────────────────────────────────────────────
+    def _write_loop(self) -> None:
+        conn    = sqlite3.connect(self.path)
+        closing = False
+        while not closing:
+            batch = []
+            try:
+                item = self.queue.get(timeout=self.flush_secs)
+                while True:
+                    if item is None:
+                        closing = True
+                        break
+                    batch.append(item)
+                    if len(batch) >= self.batch_size:
+                        break
+                    item = self.queue.get_nowait()
+            except queue.Empty:
+                pass
+
+            if batch:
+                self._write_batch(conn, batch)
+        conn.close()
+
+    def _write_batch(self, conn, batch: list) -> None:
+        # Group rows per table so each batch is a handful of executemany calls in one transaction
+        by_table = {}
+        for table, row in batch:
+            by_table.setdefault(table, []).append(row)
+        try:
+            with conn:
+                for table, rows in by_table.items():
+                    marks = ", ".join("?" * len(rows[0]))
+                    conn.executemany(f"INSERT INTO {table} VALUES ({marks})", rows)
+            return
+        except Exception as e:
+            print(f"Results store: batch of {len(batch)} rows failed ({e}) — retrying row by row")
+
+        # One bad row (or a locked DB) shouldn't cost the whole batch, or stop the writer
+        for table, row in batch:
+            try:
+                with conn:
+                    conn.execute(f"INSERT INTO {table} VALUES ({', '.join('?' * len(row))})", row)
+            except Exception as e:
+                self.dropped += 1
+                print(f"Results store: dropped {table} row — {e}")
+
+    def _put(self, table: str, row: tuple) -> None:
+        self.queue.put((table, row))
+
+    def close(self) -> int:
+        """ Flushes everything still queued and stops the writer. Returns the number of rows that could not be written. """
+        if not self.writer.is_alive():
+            self.dropped += self.queue.qsize()
+            print(f"Results store: writer stopped — {self.queue.qsize()} queued rows not written")
+        else:
+            self.queue.put(None)
+            self.writer.join()
+        if self.dropped:
+            print(f"Results store: {self.dropped} rows could not be written to {self.path}")
+        return self.dropped
+
+    # ── Recording ────────────────────────────────────────────────────
+    def start_run(self, source: str) -> str:
+        run_id = uuid.uuid4().hex
+        self._put("runs", (run_id, source, time.time()))
+        return run_id
+
+    def record_result(self, run_id: str, result: dict) -> None:
+        # One browser/config outcome plus its articles, word counts and timings
+        now   = time.time()
+        label = result["label"]
+
+        self._put("browser_results", (
+            run_id, label, result["status"], result.get("error"),
+            result.get("endpoint"), result.get("nav_route"), now,
+        ))
+        for idx, a in enumerate(result.get("articles", []), start=1):
+            self._put("articles", (
+                run_id, label, idx, a.get("title"), a.get("title_english"),
+                a.get("content"), a.get("article_url"), a.get("image_url"), now,
+                a.get("section"),
+            ))
+            for lang, text in a.get("translations", {}).items():
+                self._put("translations", (run_id, label, idx, lang, text, now))
+        for lang, counts in result.get("word_counts", {}).items():
+            for word, count in counts.items():
+                self._put("word_counts", (run_id, label, lang, word, count, now))
+        for name, secs in result.get("timings", {}).items():
+            self.record_timing(run_id, label, name, secs)
+        # Timeouts chosen for this run, next to the timings they were derived from
+        for kind, secs in result.get("timeouts", {}).items():
+            if secs is not None:
+                self.record_timing(run_id, label, f"timeout_{kind}", secs)
+
+    def record_timing(self, run_id: str, label: str, name: str, secs: float) -> None:
+        self._put("timings", (run_id, label, name, round(secs, 3), time.time()))
+
+    # ── Queries ──────────────────────────────────────────────────────
+    def word_counts_since(self, days: float = 30, lang: str = "en", limit: int = 20) -> list[tuple]:
+        """ Most frequent words recorded in the last `days` days — served from the time index, no full scan. """
+        since = time.time() - days * 86400
+        with sqlite3.connect(self.path) as conn:
+            return conn.execute(
+                "SELECT word, SUM(count) AS total FROM word_counts "
+                "WHERE lang = ? AND recorded_at >= ? "
+                "GROUP BY word ORDER BY total DESC, word LIMIT ?",
+                (lang, since, limit),
+            ).fetchall()
+
+    def timings_since(self, days: float = 30) -> list[tuple]:
+        """ Average seconds per (config, stage) over the last `days` days. """
+        since = time.time() - days * 86400
+        with sqlite3.connect(self.path) as conn:
+            return conn.execute(
+                "SELECT label, name, AVG(secs), COUNT(*) FROM timings "
+                "WHERE recorded_at >= ? GROUP BY label, name ORDER BY label, name",
+                (since,),
+            ).fetchall()
+
+    def export_parquet(self, folder: str = "results_parquet") -> list[str]:
+        """ Writes each table to a Parquet file. Needs the optional `pyarrow` package. """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet export needs pyarrow — pip install pyarrow")
+
+        os.makedirs(folder, exist_ok=True)
+        paths = []
+        with sqlite3.connect(self.path) as conn:
+            for table in TABLES:
+                cursor  = conn.execute(f"SELECT * FROM {table}")
+                columns = [c[0] for c in cursor.description]
+                rows    = cursor.fetchall()
+                data    = {col: [r[i] for r in rows] for i, col in enumerate(columns)}
+                path    = os.path.join(folder, f"{table}.parquet")
+                pq.write_table(pa.table(data), path)
+                paths.append(path)
+        return paths
+
+
+if __name__ == "__main__":
+    import sys
+
+    # python results_store.py [days] [lang]  — top words over the last N days
+    days  = float(sys.argv[1]) if len(sys.argv) > 1 else 30
+    lang  = sys.argv[2] if len(sys.argv) > 2 else "en"
+    store = ResultsStore()
+    print(f"Top words ({lang}) over the last {days:g} days:\n")
+    for word, count in store.word_counts_since(days, lang):
+        print(f"    {word:<20} {count:>4} occurrences")
+    store.close()
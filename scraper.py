@@ -1,11 +1,13 @@
 import os
 import re
 import time
+import argparse
 import requests
+import multiprocessing.util
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
 import nltk
-from nltk.tokenize import word_tokenize
 # from nltk.corpus import stopwords
 from selenium import webdriver
 
@@ -17,6 +19,9 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
+from nav_strategy import NavStats, navigate_to_opinion
+from results_store import ResultsStore
+from translation import FLAGS, target_languages, tokenize, translate_titles_multi
 
 # NLTK — download required datasets once on first run
 nltk.download("punkt",     quiet=True)
@@ -25,49 +30,6 @@ nltk.download("punkt_tab", quiet=True)
 
 # STOP_WORDS = set(stopwords.words("english"))   # 179-word built-in list
 
-#configure rapidapi key
-rapidapi_key = os.environ.get("rapidapi_key", "your_rapidapi_key")
-
-# Rapid Translate Multi Traduction endpoint + host
-translate_url  = "https://rapid-translate-multi-traduction.p.rapidapi.com/t"
-rapidapi_host  = "rapid-translate-multi-traduction.p.rapidapi.com"
-
-#translate titles
-def translate_titles(titles: list[str]) -> list[str]:
-    """ Translates a list of Spanish titles to English in a single API call using Rapid Translate Multi Traduction (RapidAPI). """
-    
-    if not rapidapi_key:
-        print("rapidapi_key not set in .env.")
-        return ["[Translation skipped — set rapidapi_key in .env]"] * len(titles)
-
-    try:
-        headers = {
-            "content-type":   "application/json",
-            "X-RapidAPI-Key":  rapidapi_key,
-            "X-RapidAPI-Host": rapidapi_host,
-        }
-        payload = {
-            "from": "es",   #from spanish
-            "to":   "en",   # to english
-            "e":    "",
-            "q":    titles, #tranlsate the titles
-        }
-        response = requests.post(translate_url, json=payload, headers=headers, timeout=15)
-        response.raise_for_status()
-        data = response.json()
-
-        if isinstance(data, list):
-            return data
-        return [str(data)] * len(titles)
-
-    except requests.exceptions.HTTPError:
-        print(f"Translation HTTP error {response.status_code}: {response.text[:200]}")
-    except Exception as e:
-        print(f"Translation error: {e}")
-
-    return ["[Translation error]"] * len(titles)
-
-
 #Image Download
 def download_image(url: str, filename: str, folder: str = "article_images") -> None:
     os.makedirs(folder, exist_ok=True)
@@ -84,72 +46,51 @@ def download_image(url: str, filename: str, folder: str = "article_images") -> N
         print(f"Image download failed: {e}")
 
 #Chrome Driver
-def create_driver() -> webdriver.Chrome:
+def create_driver(headless: bool = False, driver_path: str = None) -> webdriver.Chrome:
     options = webdriver.ChromeOptions()
     options.add_argument("--lang=es")
     options.add_argument("--accept-lang=es-ES,es;q=0.9")
     options.add_experimental_option("prefs", {"intl.accept_languages": "es,es_ES"})
     options.add_argument("--start-maximized")
     options.add_argument("--disable-notifications")
-    # options.add_argument("--headless=new")  # uncomment to hide browser window
+    if headless:
+        # Headless windows don't maximize — give them a desktop-sized viewport instead
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")
 
-    service = Service(ChromeDriverManager().install())
+    # Pool workers get the path resolved once by the parent — webdriver-manager has no lock against parallel installs
+    service = Service(driver_path or ChromeDriverManager().install())
     return webdriver.Chrome(service=service, options=options)
 
 #Scraper
 def scrape_opinion():
     driver = create_driver()
-    wait = WebDriverWait(driver, 20)
     articles_data = []
 
     try:
-        #Open El País
-        driver.get("https://elpais.com")
-        print(f"\nOpened  : {driver.current_url}")
-        print(f"Title   : {driver.title}")
-
-        #Verify Spanish
-        html_lang = driver.find_element(By.TAG_NAME, "html").get_attribute("lang") or ""
-        print(f"Language: '{html_lang}'")
-        if "es" in html_lang.lower():
-            print("Confirmed: Page is in Spanish\n")
-        else:
-            print("Language not confirmed as Spanish\n")
-
         #Accept cookie consent
+        def accept_cookies():
+            try:
+                accept_btn = WebDriverWait(driver, 7).until(
+                    EC.element_to_be_clickable((By.XPATH,
+                        "//button[contains("
+                        "translate(normalize-space(.), "
+                        "'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),"
+                        "'aceptar')]"
+                    ))
+                )
+                accept_btn.click()
+                print("Cookie consent accepted")
+                time.sleep(1.5)
+            except TimeoutException:
+                print("No cookie banner detected")
+
+        #Open El País, verify Spanish + navigate to Opinion via the fastest proven route
+        nav_stats = NavStats()
         try:
-            accept_btn = WebDriverWait(driver, 7).until(
-                EC.element_to_be_clickable((By.XPATH,
-                    "//button[contains("
-                    "translate(normalize-space(.), "
-                    "'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),"
-                    "'aceptar')]"
-                ))
-            )
-            accept_btn.click()
-            print("Cookie consent accepted")
-            time.sleep(1.5)
-        except TimeoutException:
-            print("No cookie banner detected")
-
-        #Navigate to Opinion section
-        navigated = False
-        try:
-            opinion_link = wait.until(
-                EC.element_to_be_clickable((By.XPATH,
-                    "/html/body/div[4]/header/div[2]/div[1]/nav/div/a[2]"
-                ))
-            )
-            opinion_link.click()
-            navigated = True
-        except TimeoutException:
-            pass
-
-        if not navigated:
-            print("Nav link not clickable — navigating directly to /opinion/")
-            driver.get("https://elpais.com/opinion/")
-
-        wait.until(EC.presence_of_element_located((By.TAG_NAME, "article")))
+            navigate_to_opinion(driver, "local / Chrome", nav_stats, 20, accept_cookies)
+        finally:
+            nav_stats.save()
         print(f"Opinion section: {driver.current_url}\n")
 
         #Collect first 5 article cards
@@ -245,13 +186,189 @@ def scrape_opinion():
         driver.quit()
         print("Browser closed.\n")
 
-    # Translate aLL titles 
-    print("\nTranslating titles via Rapid Translate Multi Traduction API...")
+    # Translate aLL titles — one API call per target language, all in flight at once
+    print(f"\nTranslating titles to {', '.join(target_languages)} via Rapid Translate Multi Traduction API...")
     spanish_titles = [a["title"] for a in articles_data]
-    english_titles = translate_titles(spanish_titles)
+    translations   = translate_titles_multi(spanish_titles, target_languages)
+
+    for article, translated in zip(articles_data, translations):
+        article["translations"]  = translated
+        article["title_english"] = translated.get("en", "N/A")
+
+    return articles_data
+
+#Multi-section crawl
+SECTIONS = ["opinion", "internacional", "economia", "cultura"]
+
+# One headless Chrome per worker process, reused for every task that worker takes
+_worker_driver  = None
+_worker_cookies = False
+
+
+def _init_worker(driver_path: str) -> None:
+    global _worker_driver
+    _worker_driver = create_driver(headless=True, driver_path=driver_path)
+    # Runs when the pool shuts the worker down
+    multiprocessing.util.Finalize(None, _worker_driver.quit, exitpriority=10)
+
 
-    for i, article in enumerate(articles_data):
-        article["title_english"] = english_titles[i] if i < len(english_titles) else "[Error]"
+def _accept_cookies_once(driver) -> None:
+    global _worker_cookies
+    if _worker_cookies:
+        return
+    try:
+        WebDriverWait(driver, 7).until(EC.element_to_be_clickable((By.XPATH,
+            "//button[contains("
+            "translate(normalize-space(.), "
+            "'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),"
+            "'aceptar')]"
+        ))).click()
+        time.sleep(1.5)
+    except TimeoutException:
+        pass
+    _worker_cookies = True
+
+
+def _read_card(card) -> dict:
+    info = {"title": "N/A", "content": "N/A", "image_url": None, "article_url": None}
+
+    for sel in ["h2", "h3", "h2 a", "h3 a"]:
+        try:
+            t = card.find_element(By.CSS_SELECTOR, sel).text.strip()
+            if t:
+                info["title"] = t
+                break
+        except NoSuchElementException:
+            continue
+
+    # Prefer URLs with a date slug (individual articles) over section links
+    links = card.find_elements(By.CSS_SELECTOR, "a[href]")
+    for link in links:
+        href = link.get_attribute("href") or ""
+        if re.search(r"/\d{4}-\d{2}-\d{2}/", href):
+            info["article_url"] = href
+            break
+    if not info["article_url"] and links:
+        info["article_url"] = links[0].get_attribute("href")
+
+    try:
+        info["content"] = card.find_element(By.CSS_SELECTOR, "p").text.strip() or "N/A"
+    except NoSuchElementException:
+        pass
+
+    try:
+        img = card.find_element(By.CSS_SELECTOR, "img")
+        for attr in ("src", "data-src", "data-lazy-src", "data-srcset"):
+            val = img.get_attribute(attr)
+            if val and val.startswith("http"):
+                info["image_url"] = val.split(",")[0].split(" ")[0]
+                break
+    except NoSuchElementException:
+        pass
+
+    return info
+
+
+def _scrape_section(section: str, limit: int) -> list[dict]:
+    # Work item: one section listing page
+    driver = _worker_driver
+    driver.get(f"https://elpais.com/{section}/")
+    _accept_cookies_once(driver)
+    WebDriverWait(driver, 20).until(EC.presence_of_element_located((By.TAG_NAME, "article")))
+
+    articles = []
+    for card in driver.find_elements(By.TAG_NAME, "article")[:limit]:
+        info = _read_card(card)
+        info["section"] = section
+        articles.append(info)
+    return articles
+
+
+def _fetch_bodies(urls: list[str]) -> dict:
+    # Work item: a shard of article URLs whose card had no content snippet
+    driver = _worker_driver
+    bodies = {}
+    for url in urls:
+        try:
+            driver.get(url)
+            WebDriverWait(driver, 15).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "article p, .a_c p"))
+            )
+            paras = driver.find_elements(By.CSS_SELECTOR, "article p, .a_c p")
+            bodies[url] = " ".join(p.text.strip() for p in paras[:4] if p.text.strip())[:1000]
+        except Exception as e:
+            print(f"Could not fetch article body {url}: {e}")
+    return bodies
+
+
+def scrape_sections(sections: list[str] = SECTIONS, per_section: int = 5, workers: int = None) -> list[dict]:
+    """ Scrapes several sections with a pool of headless Chrome workers and merges them into one deduplicated article list. """
+
+    # Each Chrome needs roughly a core — never start more workers than sections
+    workers = workers or max(1, min(len(sections), os.cpu_count() or 1))
+    print(f"\nScraping {len(sections)} sections with {workers} headless Chrome workers...")
+
+    start_time    = time.time()
+    articles_data = []
+    seen_urls     = set()
+    duplicates    = 0
+    driver_path   = ChromeDriverManager().install()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(driver_path,)) as executor:
+        # Stage 1 — sections
+        futures = {executor.submit(_scrape_section, sec, per_section): sec for sec in sections}
+        for future in as_completed(futures):
+            section = futures[future]
+            try:
+                found = future.result()
+            except Exception as e:
+                print(f"[{section}] Section failed: {e}")
+                continue
+
+            # Merge as results arrive — the same story often appears in several sections
+            kept = 0
+            for info in found:
+                url = info["article_url"]
+                if url and url in seen_urls:
+                    duplicates += 1
+                    continue
+                if url:
+                    seen_urls.add(url)
+                articles_data.append(info)
+                kept += 1
+            print(f"[{section}] {kept} articles ({len(found) - kept} duplicates)")
+
+        # Stage 2 — article bodies, sharded across the same workers
+        missing = [a["article_url"] for a in articles_data if a["content"] == "N/A" and a["article_url"]]
+        if missing:
+            shard  = max(1, -(-len(missing) // workers))
+            shards = [missing[i:i + shard] for i in range(0, len(missing), shard)]
+            bodies = {}
+            for future in as_completed([executor.submit(_fetch_bodies, s) for s in shards]):
+                try:
+                    bodies.update(future.result())
+                except Exception as e:
+                    print(f"Article body shard failed: {e}")
+            for a in articles_data:
+                if a["article_url"] in bodies:
+                    a["content"] = bodies[a["article_url"]]
+
+    elapsed = time.time() - start_time
+    print(f"\nScraped {len(articles_data)} unique articles ({duplicates} cross-section duplicates dropped) in {elapsed:.1f}s")
+    print(f"Throughput: {len(articles_data) / elapsed:.2f} articles/sec\n")
+
+    # Cover images — I/O only, so threads are enough
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for idx, a in enumerate(articles_data, start=1):
+            if a["image_url"]:
+                pool.submit(download_image, a["image_url"], f"{a['section']}_article_{idx}_cover")
+
+    # Translate aLL titles — one API call per target language, all in flight at once
+    print(f"\nTranslating titles to {', '.join(target_languages)} via Rapid Translate Multi Traduction API...")
+    translations = translate_titles_multi([a["title"] for a in articles_data], target_languages)
+    for article, translated in zip(articles_data, translations):
+        article["translations"]  = translated
+        article["title_english"] = translated.get("en", "N/A")
 
     return articles_data
 
@@ -262,39 +379,32 @@ def print_summary(articles: list[dict]) -> None:
     print("=" * 60)
     for i, a in enumerate(articles, start=1):
         print(f"\n  [{i}]  🇪🇸  {a['title']}")
-        print(f"        🇬🇧  {a['title_english']}")
+        for lang, text in a["translations"].items():
+            print(f"        {FLAGS.get(lang, lang)}  {text}")
     print()
 
 #Word frequency analyzer
-def analyze_word_frequency(articles: list[dict]) -> None:
+def analyze_word_frequency(articles: list[dict], lang: str = "en") -> Counter:
     
     print("=" * 60)
-    print(" Word Frequency Analysis of Translated Headers")
+    print(f" Word Frequency Analysis of Translated Headers ({lang})")
     print("=" * 60)
 
-    #Tokenize
+    #Tokenize with the language's own rules
     all_words = []
     for article in articles:
-        title = article.get("title_english", "")
+        title = article.get("translations", {}).get(lang, "")
 
         #Skip articles where translation failed or was skipped
         if not title or title.startswith("["):
             continue
 
-        tokens = word_tokenize(title.lower())
-
-        meaningful = [
-            w for w in tokens
-            if re.fullmatch(r"[^\W\d_]+", w)      #pure alphabetic
-            # and w not in STOP_WORDS      #uncomment this line if stop words are not to be included
-            and len(w) > 2
-        ]
-        all_words.extend(meaningful)
+        all_words.extend(tokenize(title, lang))
 
     if not all_words:
         print("\nNo translated titles to analyze.")
         print("Make sure rapidapi_key is set and translation succeeded.\n")
-        return
+        return Counter()
 
     #count word frequencies 
     word_counts = Counter(all_words)
@@ -323,11 +433,39 @@ def analyze_word_frequency(articles: list[dict]) -> None:
             print(f"    {word:<20} {count:>3} occurrences")
 
     print()
+    return word_counts
 
 
 if __name__ == "__main__":
-    results = scrape_opinion()
+    parser = argparse.ArgumentParser(description="El País scraper")
+    parser.add_argument("--sections", nargs="+", metavar="SECTION",
+                        help=f"crawl these sections in parallel headless workers, e.g. {' '.join(SECTIONS)}")
+    parser.add_argument("--workers", type=int, help="headless Chrome workers (default: one per core, at most one per section)")
+    parser.add_argument("--per-section", type=int, default=5, help="articles per section (default: 5)")
+    args = parser.parse_args()
+
+    start_time = time.time()
+
+    if args.sections:
+        results = scrape_sections(args.sections, args.per_section, args.workers)
+    else:
+        results = scrape_opinion()
+
+    # Created after the crawl so the worker processes don't fork with the store's writer thread
+    store  = ResultsStore()
+    run_id = store.start_run("scraper --sections" if args.sections else "scraper")
+
     print_summary(results)
-    analyze_word_frequency(results)
+    word_counts = {lang: analyze_word_frequency(results, lang) for lang in target_languages}
+
+    store.record_result(run_id, {
+        "label":       "local / sections" if args.sections else "local / Chrome",
+        "status":      "passed",
+        "articles":    results,
+        "word_counts": {lang: dict(c) for lang, c in word_counts.items()},
+        "timings":     {"total": time.time() - start_time},
+    })
+    store.close()
+    print(f"Results stored in {store.path} (run {run_id})")
     print("Execution Completed!")
     
\ No newline at end of file
@@ -0,0 +1,111 @@
+import json
+import socket
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import browserstack_parallel as bp
+from endpoint_pool import EndpointPool, EndpointUnavailable
+
+# Stand-in WebDriver servers for checking the endpoint pool without a browser or BrowserStack:
+#
+#   python stand_in_endpoints.py
+#
+# Each server answers just enough of the W3C protocol for webdriver.Remote to create and quit a session.
+
+
+def start_stand_in(reject: bool = False) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self, status: int, value) -> None:
+            body = json.dumps({"value": value}).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            if not self.path.endswith("/session"):
+                return self._reply(200, None)
+            if reject:
+                return self._reply(500, {"error": "session not created", "message": "stand-in at capacity", "stacktrace": ""})
+            self._reply(200, {"sessionId": uuid.uuid4().hex, "capabilities": {"browserName": "chrome"}})
+
+        def do_DELETE(self):
+            self._reply(200, None)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def dead_url() -> str:
+    # A port nothing listens on — connection refused, like a hub that is down
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    return f"http://127.0.0.1:{port}/wd/hub"
+
+
+def endpoint(name: str, url: str, max_sessions: int = 1) -> dict:
+    return {"name": name, "url": url, "max_sessions": max_sessions, "match": {}, "browserstack": False}
+
+
+def check(name: str, ok: bool) -> bool:
+    print(f"  {'✅' if ok else '❌'}  {name}")
+    return ok
+
+
+def main() -> None:
+    good   = start_stand_in()
+    full   = start_stand_in(reject=True)
+    config = bp.BROWSER_CONFIGS[0]
+    url    = lambda server: f"http://127.0.0.1:{server.server_address[1]}/wd/hub"
+    passed = []
+
+    print("Stand-in endpoint checks\n")
+
+    # Dead hub — fails over, and the slot is released so a second session isn't blocked
+    pool = EndpointPool([endpoint("dead", dead_url()), endpoint("good", url(good))], acquire_timeout=5)
+    for _ in range(2):
+        driver, ep = bp.start_session(config, pool)
+        driver.quit()
+        pool.release(ep)
+    passed.append(check("dead endpoint fails over and releases its slot", pool.active == {"dead": 0, "good": 0}))
+
+    # Rejected session — fails over to the next endpoint
+    pool       = EndpointPool([endpoint("full", url(full)), endpoint("good", url(good))], acquire_timeout=5)
+    driver, ep = bp.start_session(config, pool)
+    driver.quit()
+    pool.release(ep)
+    passed.append(check("rejected session fails over", ep["name"] == "good" and pool.active == {"full": 0, "good": 0}))
+
+    # Least-loaded dispatch — sessions spread by share of each endpoint's limit
+    pool    = EndpointPool([endpoint("a", url(good), 2), endpoint("b", url(good), 2)], acquire_timeout=5)
+    started = [bp.start_session(config, pool) for _ in range(4)]
+    passed.append(check("sessions spread across endpoints", pool.active == {"a": 2, "b": 2}))
+    for driver, ep in started:
+        driver.quit()
+        pool.release(ep)
+
+    # Every slot taken — acquire gives up instead of waiting forever
+    pool = EndpointPool([endpoint("good", url(good))], acquire_timeout=1)
+    pool.acquire(config)
+    try:
+        bp.start_session(config, pool)
+        passed.append(check("full pool times out", False))
+    except EndpointUnavailable:
+        passed.append(check("full pool times out", True))
+
+    good.shutdown()
+    full.shutdown()
+    print(f"\n  {sum(passed)}/{len(passed)} checks passed")
+    raise SystemExit(0 if all(passed) else 1)
+
+
+if __name__ == "__main__":
+    main()
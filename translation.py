@@ -0,0 +1,121 @@
+import os
+import re
+import time
+import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from nltk.tokenize import word_tokenize
+
+#configure rapidapi key
+rapidapi_key = os.environ.get("rapidapi_key", "")
+
+# Rapid Translate Multi Traduction endpoint + host
+translate_url = "https://rapid-translate-multi-traduction.p.rapidapi.com/t"
+rapidapi_host = "rapid-translate-multi-traduction.p.rapidapi.com"
+
+# Target languages for every run, e.g. target_languages=en,fr,de,pt in .env
+target_languages = [
+    lang.strip() for lang in os.environ.get("target_languages", "en").split(",") if lang.strip()
+]
+
+# Punkt model per language code + flag used when printing headers
+NLTK_LANGUAGES = {
+    "en": "english",
+    "fr": "french",
+    "de": "german",
+    "pt": "portuguese",
+    "es": "spanish",
+    "it": "italian",
+}
+# Elided articles/pronouns/prepositions stripped from the front of a word (l'homme → homme), longest first
+ELISIONS = {
+    "fr": ("jusqu'", "lorsqu'", "puisqu'", "qu'", "l'", "d'", "j'", "n'", "s'", "c'", "m'", "t'"),
+    "it": ("quell'", "dell'", "nell'", "dall'", "sull'", "coll'", "all'", "un'", "l'", "d'", "c'"),
+}
+# Words that keep their apostrophe — not elisions
+APOSTROPHE_WORDS = {"aujourd'hui", "presqu'île", "prud'homme", "prud'hommes", "quelqu'un", "quelqu'une"}
+
+FLAGS = {"en": "🇬🇧", "fr": "🇫🇷", "de": "🇩🇪", "pt": "🇵🇹", "es": "🇪🇸", "it": "🇮🇹"}
+
+
+#translate titles
+def translate_titles(titles: list[str], target: str = "en", log=print) -> list[str]:
+    """ Translates a list of Spanish titles to `target` in a single API call using Rapid Translate Multi Traduction (RapidAPI). """
+
+    if not rapidapi_key:
+        log("rapidapi_key not set in .env.")
+        return ["[Translation skipped — set rapidapi_key in .env]"] * len(titles)
+
+    try:
+        headers = {
+            "content-type":   "application/json",
+            "X-RapidAPI-Key":  rapidapi_key,
+            "X-RapidAPI-Host": rapidapi_host,
+        }
+        payload = {
+            "from": "es",    #from spanish
+            "to":   target,
+            "e":    "",
+            "q":    titles,  #tranlsate the titles
+        }
+        response = requests.post(translate_url, json=payload, headers=headers, timeout=15)
+        response.raise_for_status()
+        data = response.json()
+        return data if isinstance(data, list) else [str(data)] * len(titles)
+
+    except requests.exceptions.HTTPError:
+        log(f"Translation ({target}) HTTP error {response.status_code}: {response.text[:200]}")
+    except Exception as e:
+        log(f"Translation ({target}) error: {e}")
+
+    return ["[Translation error]"] * len(titles)
+
+
+def translate_titles_multi(titles: list[str], targets: list[str], log=print) -> list[dict]:
+    """ Sends one batched request per target language, all at once, so the total wait is the slowest language rather than the sum. Returns a {lang: text} map per title. """
+
+    def timed(lang):
+        start = time.time()
+        return translate_titles(titles, lang, log), time.time() - start
+
+    by_lang = {}
+    with ThreadPoolExecutor(max_workers=max(1, len(targets))) as executor:
+        futures = {executor.submit(timed, lang): lang for lang in targets}
+        for future in as_completed(futures):
+            lang                = futures[future]
+            by_lang[lang], secs = future.result()
+            log(f"Translated to {lang} in {secs:.1f}s")
+
+    # Keep the requested language order in every map
+    return [
+        {lang: by_lang[lang][i] if i < len(by_lang[lang]) else "[Error]" for lang in targets}
+        for i in range(len(titles))
+    ]
+
+
+def tokenize(title: str, lang: str = "en") -> list[str]:
+    """ Lower-cased alphabetic words longer than 2 letters. The language only picks NLTK's Punkt sentence splitter —
+        words are split by the same rules for every language, so elisions and hyphens are handled here. """
+
+    # NLTK splits on the typographic apostrophe, which would leave l’homme as "l", "’", "homme"
+    tokens   = word_tokenize(title.lower().replace("’", "'"), language=NLTK_LANGUAGES.get(lang, "english"))
+    elisions = ELISIONS.get(lang, ())
+
+    words = []
+    for token in tokens:
+        if token in APOSTROPHE_WORDS:
+            words.append(token)
+            continue
+        # French/Italian elisions (l'homme, dell'Europa) and Portuguese/French hyphenated forms (disse-lhe, peut-être)
+        prefix = next((p for p in elisions if token.startswith(p)), None)
+        if prefix:
+            token = token[len(prefix):]
+        elif token + "'" in elisions:
+            # An elision NLTK cut off from its word (jusqu'à → "jusqu", "'", "à")
+            continue
+        parts = token.split("-") if lang in ("pt", "fr") else [token]
+        words.extend(
+            w for w in parts
+            if re.fullmatch(r"[^\W\d_]+", w)      #pure alphabetic
+            and len(w) > 2
+        )
+    return words